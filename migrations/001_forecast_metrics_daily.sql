@@ -0,0 +1,67 @@
+-- Daily partial sums behind /forecast/metrics.
+--
+-- One row per (model, region, UTC day). The API composes MSE/MAE/MAPE/R²
+-- for any whole-day window by summing these partials, using
+-- Σ(y - ȳ)² = Σy² - (Σy)²/n for the R² denominator.
+--
+-- Migrations in this directory are applied in filename order with psql.
+-- The API refreshes the materialized views it reads on a schedule
+-- (see MATERIALIZED_VIEWS in app.py).
+
+CREATE MATERIALIZED VIEW staging.forecast_metrics_daily AS
+WITH compare AS (
+  SELECT 'statistical' AS model, hour_end,
+         coast_actual, coast_expected, east_actual, east_expected,
+         far_west_actual, far_west_expected, north_actual, north_expected,
+         north_c_actual, north_c_expected, southern_actual, southern_expected,
+         south_c_actual, south_c_expected, west_actual, west_expected,
+         ercot_actual, ercot_expected
+  FROM staging.ercot_load_wide_compare
+  UNION ALL
+  SELECT 'xgb' AS model, hour_end,
+         coast_actual, coast_expected, east_actual, east_expected,
+         far_west_actual, far_west_expected, north_actual, north_expected,
+         north_c_actual, north_c_expected, southern_actual, southern_expected,
+         south_c_actual, south_c_expected, west_actual, west_expected,
+         ercot_actual, ercot_expected
+  FROM staging.ercot_load_wide_compare_xgb
+),
+pairs AS (
+  SELECT model, hour_end, 'coast' AS region, coast_actual AS y, coast_expected AS yhat
+  FROM compare
+  UNION ALL SELECT model, hour_end, 'east', east_actual, east_expected
+  FROM compare
+  UNION ALL SELECT model, hour_end, 'far_west', far_west_actual, far_west_expected
+  FROM compare
+  UNION ALL SELECT model, hour_end, 'north', north_actual, north_expected
+  FROM compare
+  UNION ALL SELECT model, hour_end, 'north_c', north_c_actual, north_c_expected
+  FROM compare
+  UNION ALL SELECT model, hour_end, 'southern', southern_actual, southern_expected
+  FROM compare
+  UNION ALL SELECT model, hour_end, 'south_c', south_c_actual, south_c_expected
+  FROM compare
+  UNION ALL SELECT model, hour_end, 'west', west_actual, west_expected
+  FROM compare
+  UNION ALL SELECT model, hour_end, 'ercot', ercot_actual, ercot_expected
+  FROM compare
+)
+SELECT
+  model,
+  region,
+  (hour_end AT TIME ZONE 'UTC')::date                            AS day,
+  COUNT(*)                                                       AS n,
+  COUNT(y - yhat)                                                AS n_err,
+  COUNT(CASE WHEN y <> 0 THEN y - yhat END)                      AS n_pct,
+  COUNT(y)                                                       AS n_y,
+  SUM(y)                                                         AS sum_y,
+  SUM(y^2)                                                       AS sum_y2,
+  SUM((y - yhat)^2)                                              AS sum_sq_err,
+  SUM(ABS(y - yhat))                                             AS sum_abs_err,
+  SUM(CASE WHEN y = 0 THEN NULL ELSE ABS(y - yhat) / ABS(y) END) AS sum_abs_pct_err
+FROM pairs
+GROUP BY model, region, (hour_end AT TIME ZONE 'UTC')::date;
+
+-- Unique index required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX forecast_metrics_daily_model_region_day_idx
+  ON staging.forecast_metrics_daily (model, region, day);
@@ -0,0 +1,60 @@
+-- Rebuild staging.forecast_metrics_daily with a single-scan unpivot.
+--
+-- The 9-way UNION ALL in 001 read each comparison table nine times;
+-- CROSS JOIN LATERAL (VALUES ...) emits the nine (region, y, yhat) pairs
+-- from one pass over each row.
+
+DROP MATERIALIZED VIEW staging.forecast_metrics_daily;
+
+CREATE MATERIALIZED VIEW staging.forecast_metrics_daily AS
+WITH compare AS (
+  SELECT 'statistical' AS model, hour_end,
+         coast_actual, coast_expected, east_actual, east_expected,
+         far_west_actual, far_west_expected, north_actual, north_expected,
+         north_c_actual, north_c_expected, southern_actual, southern_expected,
+         south_c_actual, south_c_expected, west_actual, west_expected,
+         ercot_actual, ercot_expected
+  FROM staging.ercot_load_wide_compare
+  UNION ALL
+  SELECT 'xgb' AS model, hour_end,
+         coast_actual, coast_expected, east_actual, east_expected,
+         far_west_actual, far_west_expected, north_actual, north_expected,
+         north_c_actual, north_c_expected, southern_actual, southern_expected,
+         south_c_actual, south_c_expected, west_actual, west_expected,
+         ercot_actual, ercot_expected
+  FROM staging.ercot_load_wide_compare_xgb
+),
+pairs AS (
+  SELECT c.model, c.hour_end, p.region, p.y, p.yhat
+  FROM compare c
+  CROSS JOIN LATERAL (
+    VALUES
+      ('coast',    c.coast_actual,    c.coast_expected),
+      ('east',     c.east_actual,     c.east_expected),
+      ('far_west', c.far_west_actual, c.far_west_expected),
+      ('north',    c.north_actual,    c.north_expected),
+      ('north_c',  c.north_c_actual,  c.north_c_expected),
+      ('southern', c.southern_actual, c.southern_expected),
+      ('south_c',  c.south_c_actual,  c.south_c_expected),
+      ('west',     c.west_actual,     c.west_expected),
+      ('ercot',    c.ercot_actual,    c.ercot_expected)
+  ) AS p(region, y, yhat)
+)
+SELECT
+  model,
+  region,
+  (hour_end AT TIME ZONE 'UTC')::date                            AS day,
+  COUNT(*)                                                       AS n,
+  COUNT(y - yhat)                                                AS n_err,
+  COUNT(CASE WHEN y <> 0 THEN y - yhat END)                      AS n_pct,
+  COUNT(y)                                                       AS n_y,
+  SUM(y)                                                         AS sum_y,
+  SUM(y^2)                                                       AS sum_y2,
+  SUM((y - yhat)^2)                                              AS sum_sq_err,
+  SUM(ABS(y - yhat))                                             AS sum_abs_err,
+  SUM(CASE WHEN y = 0 THEN NULL ELSE ABS(y - yhat) / ABS(y) END) AS sum_abs_pct_err
+FROM pairs
+GROUP BY model, region, (hour_end AT TIME ZONE 'UTC')::date;
+
+CREATE UNIQUE INDEX forecast_metrics_daily_model_region_day_idx
+  ON staging.forecast_metrics_daily (model, region, day);
@@ -0,0 +1,37 @@
+-- Covering indexes for the hour_end range scans in /load/hourly and /load/comparison.
+--
+-- Both endpoints filter and ORDER BY hour_end and return every load column, so
+-- an index on hour_end that INCLUDEs those columns lets Postgres answer them with
+-- an index-only scan. Clustering the heap on the same index keeps the physical
+-- row order aligned with the query order for the pages that still need a heap
+-- visit. Re-run maintenance/cluster_by_hour_end.sql monthly to restore the order
+-- as new hours are appended.
+
+CREATE INDEX IF NOT EXISTS ercot_load_hour_end_idx
+  ON ercot_load (hour_end)
+  INCLUDE (coast, east, far_west, north, north_c, southern, south_c, west, ercot);
+
+CREATE INDEX IF NOT EXISTS ercot_load_wide_compare_hour_end_idx
+  ON staging.ercot_load_wide_compare (hour_end)
+  INCLUDE (coast_actual, coast_expected, east_actual, east_expected,
+           far_west_actual, far_west_expected, north_actual, north_expected,
+           north_c_actual, north_c_expected, southern_actual, southern_expected,
+           south_c_actual, south_c_expected, west_actual, west_expected,
+           ercot_actual, ercot_expected);
+
+CREATE INDEX IF NOT EXISTS ercot_load_wide_compare_xgb_hour_end_idx
+  ON staging.ercot_load_wide_compare_xgb (hour_end)
+  INCLUDE (coast_actual, coast_expected, east_actual, east_expected,
+           far_west_actual, far_west_expected, north_actual, north_expected,
+           north_c_actual, north_c_expected, southern_actual, southern_expected,
+           south_c_actual, south_c_expected, west_actual, west_expected,
+           ercot_actual, ercot_expected);
+
+CLUSTER ercot_load USING ercot_load_hour_end_idx;
+CLUSTER staging.ercot_load_wide_compare USING ercot_load_wide_compare_hour_end_idx;
+CLUSTER staging.ercot_load_wide_compare_xgb USING ercot_load_wide_compare_xgb_hour_end_idx;
+
+-- VACUUM sets the visibility map bits that index-only scans rely on
+VACUUM ANALYZE ercot_load;
+VACUUM ANALYZE staging.ercot_load_wide_compare;
+VACUUM ANALYZE staging.ercot_load_wide_compare_xgb;
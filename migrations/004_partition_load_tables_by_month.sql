@@ -0,0 +1,194 @@
+-- Range-partition the load tables by calendar month (UTC) on hour_end.
+--
+-- Every time-filtered endpoint bounds hour_end, so the planner prunes the
+-- months outside the window (at plan time for literals, at executor startup
+-- for bound parameters) and only the matching partitions and their smaller
+-- covering indexes are read. The API queries are unchanged.
+--
+-- Each table is renamed aside, recreated as a partitioned parent with monthly
+-- children covering the existing data plus the next twelve months, refilled,
+-- and the old copy dropped. staging.forecast_metrics_daily reads the
+-- comparison tables, so it is rebuilt afterwards. Rows outside the created
+-- months land in a DEFAULT partition; run maintenance/create_monthly_partitions.sql
+-- ahead of time so new hours go to their own month instead.
+
+BEGIN;
+
+-- Creates <parent>_YYYY_MM partitions for each month in [first_month, last_month].
+-- Bounds are UTC midnights regardless of the session TimeZone.
+CREATE OR REPLACE FUNCTION staging.create_monthly_partitions(
+  parent regclass, first_month date, last_month date
+) RETURNS void
+LANGUAGE plpgsql AS $$
+DECLARE
+  parent_schema name;
+  parent_name   name;
+  month_start   date := date_trunc('month', first_month)::date;
+BEGIN
+  SELECT n.nspname, c.relname
+    INTO parent_schema, parent_name
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+   WHERE c.oid = parent;
+
+  WHILE month_start <= last_month LOOP
+    EXECUTE format(
+      'CREATE TABLE IF NOT EXISTS %I.%I PARTITION OF %s FOR VALUES FROM (%L) TO (%L)',
+      parent_schema,
+      parent_name || to_char(month_start, '_YYYY_MM'),
+      parent,
+      month_start::timestamp AT TIME ZONE 'UTC',
+      (month_start + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+    );
+    month_start := (month_start + interval '1 month')::date;
+  END LOOP;
+END;
+$$;
+
+-- Creates the monthly partitions spanning the data in source, plus twelve
+-- months ahead, and a DEFAULT partition for anything outside that range.
+CREATE OR REPLACE FUNCTION staging.create_partitions_for(parent regclass, source regclass)
+RETURNS void
+LANGUAGE plpgsql AS $$
+DECLARE
+  first_month date;
+  last_month  date;
+BEGIN
+  EXECUTE format(
+    'SELECT (MIN(hour_end) AT TIME ZONE ''UTC'')::date, (MAX(hour_end) AT TIME ZONE ''UTC'')::date FROM %s',
+    source
+  ) INTO first_month, last_month;
+
+  first_month := COALESCE(first_month, current_date);
+  last_month  := (GREATEST(COALESCE(last_month, current_date), current_date) + interval '12 months')::date;
+
+  PERFORM staging.create_monthly_partitions(parent, first_month, last_month);
+  EXECUTE format('CREATE TABLE IF NOT EXISTS %s_default PARTITION OF %s DEFAULT', parent, parent);
+END;
+$$;
+
+DROP MATERIALIZED VIEW staging.forecast_metrics_daily;
+
+-- ercot_load
+ALTER TABLE ercot_load RENAME TO ercot_load_unpartitioned;
+ALTER INDEX IF EXISTS ercot_load_pkey RENAME TO ercot_load_unpartitioned_pkey;
+ALTER INDEX IF EXISTS ercot_load_hour_end_idx RENAME TO ercot_load_unpartitioned_hour_end_idx;
+
+CREATE TABLE ercot_load (
+  LIKE ercot_load_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+  PRIMARY KEY (hour_end)
+) PARTITION BY RANGE (hour_end);
+
+SELECT staging.create_partitions_for('ercot_load', 'ercot_load_unpartitioned');
+INSERT INTO ercot_load SELECT * FROM ercot_load_unpartitioned;
+DROP TABLE ercot_load_unpartitioned;
+
+CREATE INDEX ercot_load_hour_end_idx
+  ON ercot_load (hour_end)
+  INCLUDE (coast, east, far_west, north, north_c, southern, south_c, west, ercot);
+
+-- staging.ercot_load_wide_compare
+ALTER TABLE staging.ercot_load_wide_compare RENAME TO ercot_load_wide_compare_unpartitioned;
+ALTER INDEX IF EXISTS staging.ercot_load_wide_compare_hour_end_idx
+  RENAME TO ercot_load_wide_compare_unpartitioned_hour_end_idx;
+
+CREATE TABLE staging.ercot_load_wide_compare (
+  LIKE staging.ercot_load_wide_compare_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+) PARTITION BY RANGE (hour_end);
+
+SELECT staging.create_partitions_for('staging.ercot_load_wide_compare',
+                                     'staging.ercot_load_wide_compare_unpartitioned');
+INSERT INTO staging.ercot_load_wide_compare
+  SELECT * FROM staging.ercot_load_wide_compare_unpartitioned;
+DROP TABLE staging.ercot_load_wide_compare_unpartitioned;
+
+CREATE INDEX ercot_load_wide_compare_hour_end_idx
+  ON staging.ercot_load_wide_compare (hour_end)
+  INCLUDE (coast_actual, coast_expected, east_actual, east_expected,
+           far_west_actual, far_west_expected, north_actual, north_expected,
+           north_c_actual, north_c_expected, southern_actual, southern_expected,
+           south_c_actual, south_c_expected, west_actual, west_expected,
+           ercot_actual, ercot_expected);
+
+-- staging.ercot_load_wide_compare_xgb
+ALTER TABLE staging.ercot_load_wide_compare_xgb RENAME TO ercot_load_wide_compare_xgb_unpartitioned;
+ALTER INDEX IF EXISTS staging.ercot_load_wide_compare_xgb_hour_end_idx
+  RENAME TO ercot_load_wide_compare_xgb_unpartitioned_hour_end_idx;
+
+CREATE TABLE staging.ercot_load_wide_compare_xgb (
+  LIKE staging.ercot_load_wide_compare_xgb_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+) PARTITION BY RANGE (hour_end);
+
+SELECT staging.create_partitions_for('staging.ercot_load_wide_compare_xgb',
+                                     'staging.ercot_load_wide_compare_xgb_unpartitioned');
+INSERT INTO staging.ercot_load_wide_compare_xgb
+  SELECT * FROM staging.ercot_load_wide_compare_xgb_unpartitioned;
+DROP TABLE staging.ercot_load_wide_compare_xgb_unpartitioned;
+
+CREATE INDEX ercot_load_wide_compare_xgb_hour_end_idx
+  ON staging.ercot_load_wide_compare_xgb (hour_end)
+  INCLUDE (coast_actual, coast_expected, east_actual, east_expected,
+           far_west_actual, far_west_expected, north_actual, north_expected,
+           north_c_actual, north_c_expected, southern_actual, southern_expected,
+           south_c_actual, south_c_expected, west_actual, west_expected,
+           ercot_actual, ercot_expected);
+
+-- Same definition as 002, now over the partitioned tables
+CREATE MATERIALIZED VIEW staging.forecast_metrics_daily AS
+WITH compare AS (
+  SELECT 'statistical' AS model, hour_end,
+         coast_actual, coast_expected, east_actual, east_expected,
+         far_west_actual, far_west_expected, north_actual, north_expected,
+         north_c_actual, north_c_expected, southern_actual, southern_expected,
+         south_c_actual, south_c_expected, west_actual, west_expected,
+         ercot_actual, ercot_expected
+  FROM staging.ercot_load_wide_compare
+  UNION ALL
+  SELECT 'xgb' AS model, hour_end,
+         coast_actual, coast_expected, east_actual, east_expected,
+         far_west_actual, far_west_expected, north_actual, north_expected,
+         north_c_actual, north_c_expected, southern_actual, southern_expected,
+         south_c_actual, south_c_expected, west_actual, west_expected,
+         ercot_actual, ercot_expected
+  FROM staging.ercot_load_wide_compare_xgb
+),
+pairs AS (
+  SELECT c.model, c.hour_end, p.region, p.y, p.yhat
+  FROM compare c
+  CROSS JOIN LATERAL (
+    VALUES
+      ('coast',    c.coast_actual,    c.coast_expected),
+      ('east',     c.east_actual,     c.east_expected),
+      ('far_west', c.far_west_actual, c.far_west_expected),
+      ('north',    c.north_actual,    c.north_expected),
+      ('north_c',  c.north_c_actual,  c.north_c_expected),
+      ('southern', c.southern_actual, c.southern_expected),
+      ('south_c',  c.south_c_actual,  c.south_c_expected),
+      ('west',     c.west_actual,     c.west_expected),
+      ('ercot',    c.ercot_actual,    c.ercot_expected)
+  ) AS p(region, y, yhat)
+)
+SELECT
+  model,
+  region,
+  (hour_end AT TIME ZONE 'UTC')::date                            AS day,
+  COUNT(*)                                                       AS n,
+  COUNT(y - yhat)                                                AS n_err,
+  COUNT(CASE WHEN y <> 0 THEN y - yhat END)                      AS n_pct,
+  COUNT(y)                                                       AS n_y,
+  SUM(y)                                                         AS sum_y,
+  SUM(y^2)                                                       AS sum_y2,
+  SUM((y - yhat)^2)                                              AS sum_sq_err,
+  SUM(ABS(y - yhat))                                             AS sum_abs_err,
+  SUM(CASE WHEN y = 0 THEN NULL ELSE ABS(y - yhat) / ABS(y) END) AS sum_abs_pct_err
+FROM pairs
+GROUP BY model, region, (hour_end AT TIME ZONE 'UTC')::date;
+
+CREATE UNIQUE INDEX forecast_metrics_daily_model_region_day_idx
+  ON staging.forecast_metrics_daily (model, region, day);
+
+COMMIT;
+
+VACUUM ANALYZE ercot_load;
+VACUUM ANALYZE staging.ercot_load_wide_compare;
+VACUUM ANALYZE staging.ercot_load_wide_compare_xgb;
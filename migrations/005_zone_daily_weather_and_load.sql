@@ -0,0 +1,43 @@
+-- Per-zone daily weather and load behind /weather/heatwaves and /weather/precipitation.
+--
+-- Both endpoints aggregated weather_hourly and the unpivoted ercot_load to one
+-- row per (UTC day, zone) on every call. Days do not change once ingested, so
+-- the daily rollups are stored here and refreshed by the API alongside
+-- staging.forecast_metrics_daily.
+
+CREATE MATERIALIZED VIEW staging.weather_zone_daily AS
+SELECT
+  (wh.time AT TIME ZONE 'UTC')::date           AS day_utc,
+  szm.zone,
+  MAX( (wh.temperature_2m_c * 9.0/5.0) + 32.0 ) AS temp_max_f,
+  SUM(wh.precipitation_mm)                      AS precip_mm_sum
+FROM weather_hourly wh
+JOIN station_zone_map szm
+  ON szm.station_id = wh.station_id
+GROUP BY (wh.time AT TIME ZONE 'UTC')::date, szm.zone;
+
+CREATE UNIQUE INDEX weather_zone_daily_zone_day_idx
+  ON staging.weather_zone_daily (zone, day_utc);
+
+CREATE MATERIALIZED VIEW staging.zone_daily_load AS
+SELECT
+  (el.hour_end AT TIME ZONE 'UTC')::date AS day_utc,
+  z.zone,
+  MAX(z.load_mw)                         AS peak_mw,
+  AVG(z.load_mw)                         AS avg_mw
+FROM ercot_load el
+CROSS JOIN LATERAL (
+  VALUES
+    ('coast',   el.coast),
+    ('east',    el.east),
+    ('far_west',el.far_west),
+    ('north',   el.north),
+    ('north_c', el.north_c),
+    ('southern',el.southern),
+    ('south_c', el.south_c),
+    ('west',    el.west)
+) AS z(zone, load_mw)
+GROUP BY (el.hour_end AT TIME ZONE 'UTC')::date, z.zone;
+
+CREATE UNIQUE INDEX zone_daily_load_zone_day_idx
+  ON staging.zone_daily_load (zone, day_utc);
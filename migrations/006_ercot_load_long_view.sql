@@ -0,0 +1,41 @@
+-- Long (one row per hour and region) form of ercot_load.
+--
+-- The wide→long unpivot was repeated in the API queries and in
+-- staging.zone_daily_load. It is a plain view, so predicates on hour_end
+-- still reach ercot_load and prune its monthly partitions.
+
+CREATE VIEW staging.ercot_load_long AS
+SELECT
+  el.hour_end,
+  (el.hour_end AT TIME ZONE 'UTC')::date AS day_utc,
+  z.zone_code,
+  z.load_mw
+FROM ercot_load el
+CROSS JOIN LATERAL (
+  VALUES
+    ('coast',   el.coast),
+    ('east',    el.east),
+    ('far_west',el.far_west),
+    ('north',   el.north),
+    ('north_c', el.north_c),
+    ('southern',el.southern),
+    ('south_c', el.south_c),
+    ('west',    el.west),
+    ('ercot',   el.ercot)
+) AS z(zone_code, load_mw);
+
+-- Rebuild the daily zone rollup from 005 on top of the view
+DROP MATERIALIZED VIEW staging.zone_daily_load;
+
+CREATE MATERIALIZED VIEW staging.zone_daily_load AS
+SELECT
+  day_utc,
+  zone_code     AS zone,
+  MAX(load_mw)  AS peak_mw,
+  AVG(load_mw)  AS avg_mw
+FROM staging.ercot_load_long
+WHERE zone_code <> 'ercot'
+GROUP BY day_utc, zone_code;
+
+CREATE UNIQUE INDEX zone_daily_load_zone_day_idx
+  ON staging.zone_daily_load (zone, day_utc);
@@ -0,0 +1,155 @@
+-- Store the MW load columns as double precision.
+--
+-- numeric values cross the wire as text and decode to Decimal, which is far
+-- slower to build and serialize than float. The API also registers a float
+-- decoder for numeric (see init_connection in app.py), but native float8
+-- columns skip the text round trip entirely. Columns that are already double
+-- precision are left as they are; the type change does not rewrite them.
+--
+-- A column cannot change type while a view reads it, so the views built on
+-- these tables are dropped and recreated with their existing definitions.
+
+BEGIN;
+
+DROP MATERIALIZED VIEW staging.zone_daily_load;
+DROP VIEW staging.ercot_load_long;
+DROP MATERIALIZED VIEW staging.forecast_metrics_daily;
+
+ALTER TABLE ercot_load
+  ALTER COLUMN coast TYPE double precision,
+  ALTER COLUMN east TYPE double precision,
+  ALTER COLUMN far_west TYPE double precision,
+  ALTER COLUMN north TYPE double precision,
+  ALTER COLUMN north_c TYPE double precision,
+  ALTER COLUMN southern TYPE double precision,
+  ALTER COLUMN south_c TYPE double precision,
+  ALTER COLUMN west TYPE double precision,
+  ALTER COLUMN ercot TYPE double precision;
+
+ALTER TABLE staging.ercot_load_wide_compare
+  ALTER COLUMN coast_actual TYPE double precision,
+  ALTER COLUMN coast_expected TYPE double precision,
+  ALTER COLUMN east_actual TYPE double precision,
+  ALTER COLUMN east_expected TYPE double precision,
+  ALTER COLUMN far_west_actual TYPE double precision,
+  ALTER COLUMN far_west_expected TYPE double precision,
+  ALTER COLUMN north_actual TYPE double precision,
+  ALTER COLUMN north_expected TYPE double precision,
+  ALTER COLUMN north_c_actual TYPE double precision,
+  ALTER COLUMN north_c_expected TYPE double precision,
+  ALTER COLUMN southern_actual TYPE double precision,
+  ALTER COLUMN southern_expected TYPE double precision,
+  ALTER COLUMN south_c_actual TYPE double precision,
+  ALTER COLUMN south_c_expected TYPE double precision,
+  ALTER COLUMN west_actual TYPE double precision,
+  ALTER COLUMN west_expected TYPE double precision,
+  ALTER COLUMN ercot_actual TYPE double precision,
+  ALTER COLUMN ercot_expected TYPE double precision;
+
+ALTER TABLE staging.ercot_load_wide_compare_xgb
+  ALTER COLUMN coast_actual TYPE double precision,
+  ALTER COLUMN coast_expected TYPE double precision,
+  ALTER COLUMN east_actual TYPE double precision,
+  ALTER COLUMN east_expected TYPE double precision,
+  ALTER COLUMN far_west_actual TYPE double precision,
+  ALTER COLUMN far_west_expected TYPE double precision,
+  ALTER COLUMN north_actual TYPE double precision,
+  ALTER COLUMN north_expected TYPE double precision,
+  ALTER COLUMN north_c_actual TYPE double precision,
+  ALTER COLUMN north_c_expected TYPE double precision,
+  ALTER COLUMN southern_actual TYPE double precision,
+  ALTER COLUMN southern_expected TYPE double precision,
+  ALTER COLUMN south_c_actual TYPE double precision,
+  ALTER COLUMN south_c_expected TYPE double precision,
+  ALTER COLUMN west_actual TYPE double precision,
+  ALTER COLUMN west_expected TYPE double precision,
+  ALTER COLUMN ercot_actual TYPE double precision,
+  ALTER COLUMN ercot_expected TYPE double precision;
+
+CREATE VIEW staging.ercot_load_long AS
+SELECT
+  el.hour_end,
+  (el.hour_end AT TIME ZONE 'UTC')::date AS day_utc,
+  z.zone_code,
+  z.load_mw
+FROM ercot_load el
+CROSS JOIN LATERAL (
+  VALUES
+    ('coast',   el.coast),
+    ('east',    el.east),
+    ('far_west',el.far_west),
+    ('north',   el.north),
+    ('north_c', el.north_c),
+    ('southern',el.southern),
+    ('south_c', el.south_c),
+    ('west',    el.west),
+    ('ercot',   el.ercot)
+) AS z(zone_code, load_mw);
+
+CREATE MATERIALIZED VIEW staging.zone_daily_load AS
+SELECT
+  day_utc,
+  zone_code     AS zone,
+  MAX(load_mw)  AS peak_mw,
+  AVG(load_mw)  AS avg_mw
+FROM staging.ercot_load_long
+WHERE zone_code <> 'ercot'
+GROUP BY day_utc, zone_code;
+
+CREATE UNIQUE INDEX zone_daily_load_zone_day_idx
+  ON staging.zone_daily_load (zone, day_utc);
+
+CREATE MATERIALIZED VIEW staging.forecast_metrics_daily AS
+WITH compare AS (
+  SELECT 'statistical' AS model, hour_end,
+         coast_actual, coast_expected, east_actual, east_expected,
+         far_west_actual, far_west_expected, north_actual, north_expected,
+         north_c_actual, north_c_expected, southern_actual, southern_expected,
+         south_c_actual, south_c_expected, west_actual, west_expected,
+         ercot_actual, ercot_expected
+  FROM staging.ercot_load_wide_compare
+  UNION ALL
+  SELECT 'xgb' AS model, hour_end,
+         coast_actual, coast_expected, east_actual, east_expected,
+         far_west_actual, far_west_expected, north_actual, north_expected,
+         north_c_actual, north_c_expected, southern_actual, southern_expected,
+         south_c_actual, south_c_expected, west_actual, west_expected,
+         ercot_actual, ercot_expected
+  FROM staging.ercot_load_wide_compare_xgb
+),
+pairs AS (
+  SELECT c.model, c.hour_end, p.region, p.y, p.yhat
+  FROM compare c
+  CROSS JOIN LATERAL (
+    VALUES
+      ('coast',    c.coast_actual,    c.coast_expected),
+      ('east',     c.east_actual,     c.east_expected),
+      ('far_west', c.far_west_actual, c.far_west_expected),
+      ('north',    c.north_actual,    c.north_expected),
+      ('north_c',  c.north_c_actual,  c.north_c_expected),
+      ('southern', c.southern_actual, c.southern_expected),
+      ('south_c',  c.south_c_actual,  c.south_c_expected),
+      ('west',     c.west_actual,     c.west_expected),
+      ('ercot',    c.ercot_actual,    c.ercot_expected)
+  ) AS p(region, y, yhat)
+)
+SELECT
+  model,
+  region,
+  (hour_end AT TIME ZONE 'UTC')::date                            AS day,
+  COUNT(*)                                                       AS n,
+  COUNT(y - yhat)                                                AS n_err,
+  COUNT(CASE WHEN y <> 0 THEN y - yhat END)                      AS n_pct,
+  COUNT(y)                                                       AS n_y,
+  SUM(y)                                                         AS sum_y,
+  SUM(y^2)                                                       AS sum_y2,
+  SUM((y - yhat)^2)                                              AS sum_sq_err,
+  SUM(ABS(y - yhat))                                             AS sum_abs_err,
+  SUM(CASE WHEN y = 0 THEN NULL ELSE ABS(y - yhat) / ABS(y) END) AS sum_abs_pct_err
+FROM pairs
+GROUP BY model, region, (hour_end AT TIME ZONE 'UTC')::date;
+
+CREATE UNIQUE INDEX forecast_metrics_daily_model_region_day_idx
+  ON staging.forecast_metrics_daily (model, region, day);
+
+COMMIT;
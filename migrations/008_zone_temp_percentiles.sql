@@ -0,0 +1,18 @@
+-- Per-zone daily max temperature cutoffs behind /load/peak-load-extreme-heat.
+--
+-- The endpoint's default and common thresholds are the 90th, 95th and 99th
+-- percentiles. Each cutoff otherwise needs a sort of every day in the zone per
+-- request. Other thresholds are still computed live. Built on
+-- staging.weather_zone_daily, so it must be refreshed after that view.
+
+CREATE MATERIALIZED VIEW staging.zone_temp_percentiles AS
+SELECT
+  wzd.zone,
+  v.percentile,
+  percentile_cont(v.percentile / 100.0) WITHIN GROUP (ORDER BY wzd.temp_max_f) AS cutoff_f
+FROM staging.weather_zone_daily wzd
+CROSS JOIN (VALUES (90), (95), (99)) AS v(percentile)
+GROUP BY wzd.zone, v.percentile;
+
+CREATE UNIQUE INDEX zone_temp_percentiles_zone_percentile_idx
+  ON staging.zone_temp_percentiles (zone, percentile);
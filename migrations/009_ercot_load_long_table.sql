@@ -0,0 +1,85 @@
+-- Replace the staging.ercot_load_long view with a table kept in sync by trigger.
+--
+-- The view re-ran the nine-way unpivot of ercot_load on every read. The long
+-- rows are now stored once, keyed by (region, hour_end), so per-region scans
+-- read only that region's rows. An AFTER trigger on ercot_load mirrors every
+-- insert, update and delete; on the partitioned table it is cloned to each
+-- partition, including ones created later.
+
+BEGIN;
+
+CREATE TABLE ercot_load_long (
+  hour_end timestamptz NOT NULL,
+  region   text        NOT NULL,
+  load_mw  double precision,
+  day_utc  date GENERATED ALWAYS AS ((hour_end AT TIME ZONE 'UTC')::date) STORED,
+  PRIMARY KEY (region, hour_end)
+);
+
+-- Date-window scans across all regions, and the trigger's delete by hour_end
+CREATE INDEX ercot_load_long_hour_end_idx ON ercot_load_long (hour_end);
+
+INSERT INTO ercot_load_long (hour_end, region, load_mw)
+SELECT el.hour_end, z.region, z.load_mw
+FROM ercot_load el
+CROSS JOIN LATERAL (
+  VALUES
+    ('coast',   el.coast),
+    ('east',    el.east),
+    ('far_west',el.far_west),
+    ('north',   el.north),
+    ('north_c', el.north_c),
+    ('southern',el.southern),
+    ('south_c', el.south_c),
+    ('west',    el.west),
+    ('ercot',   el.ercot)
+) AS z(region, load_mw);
+
+CREATE FUNCTION staging.sync_ercot_load_long() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    DELETE FROM ercot_load_long WHERE hour_end = OLD.hour_end;
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    INSERT INTO ercot_load_long (hour_end, region, load_mw)
+    VALUES
+      (NEW.hour_end, 'coast',    NEW.coast),
+      (NEW.hour_end, 'east',     NEW.east),
+      (NEW.hour_end, 'far_west', NEW.far_west),
+      (NEW.hour_end, 'north',    NEW.north),
+      (NEW.hour_end, 'north_c',  NEW.north_c),
+      (NEW.hour_end, 'southern', NEW.southern),
+      (NEW.hour_end, 'south_c',  NEW.south_c),
+      (NEW.hour_end, 'west',     NEW.west),
+      (NEW.hour_end, 'ercot',    NEW.ercot)
+    ON CONFLICT (region, hour_end) DO UPDATE SET load_mw = EXCLUDED.load_mw;
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER ercot_load_sync_long
+  AFTER INSERT OR UPDATE OR DELETE ON ercot_load
+  FOR EACH ROW EXECUTE FUNCTION staging.sync_ercot_load_long();
+
+-- Repoint the daily zone rollup from 006 at the table, then drop the view
+DROP MATERIALIZED VIEW staging.zone_daily_load;
+DROP VIEW staging.ercot_load_long;
+
+CREATE MATERIALIZED VIEW staging.zone_daily_load AS
+SELECT
+  day_utc,
+  region        AS zone,
+  MAX(load_mw)  AS peak_mw,
+  AVG(load_mw)  AS avg_mw
+FROM ercot_load_long
+WHERE region <> 'ercot'
+GROUP BY day_utc, region;
+
+CREATE UNIQUE INDEX zone_daily_load_zone_day_idx
+  ON staging.zone_daily_load (zone, day_utc);
+
+COMMIT;
+
+ANALYZE ercot_load_long;
@@ -0,0 +1,19 @@
+-- System-wide daily average load behind /load/outliers/weather-conditions.
+--
+-- month_start is stored next to each day so the monthly statistics group and
+-- join on a plain date column instead of evaluating date_trunc per row.
+
+CREATE MATERIALIZED VIEW staging.ercot_daily_load AS
+SELECT
+  day_utc,
+  day_utc - (EXTRACT(DAY FROM day_utc)::int - 1) AS month_start,
+  AVG(load_mw)                                   AS daily_avg_mw
+FROM ercot_load_long
+WHERE region = 'ercot'
+GROUP BY day_utc;
+
+CREATE UNIQUE INDEX ercot_daily_load_day_idx
+  ON staging.ercot_daily_load (day_utc);
+
+CREATE INDEX ercot_daily_load_month_start_idx
+  ON staging.ercot_daily_load (month_start);
@@ -0,0 +1,16 @@
+-- All-time mean and standard deviation of hourly load per region.
+--
+-- /load/outliers without a date window measures every hour against these
+-- statistics; storing them saves a full aggregate pass over ercot_load_long
+-- per request. Windowed requests still compute their statistics live.
+
+CREATE MATERIALIZED VIEW staging.region_load_stats AS
+SELECT
+  region,
+  AVG(load_mw)         AS mean,
+  STDDEV_SAMP(load_mw) AS std_dev
+FROM ercot_load_long
+GROUP BY region;
+
+CREATE UNIQUE INDEX region_load_stats_region_idx
+  ON staging.region_load_stats (region);
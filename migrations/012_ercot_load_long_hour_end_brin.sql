@@ -0,0 +1,15 @@
+-- Replace the hour_end B-tree on ercot_load_long with a BRIN index.
+--
+-- ercot_load_long is written in hour_end order (backfill, then the ercot_load
+-- trigger as hours arrive), so each block range covers a narrow time span and
+-- a BRIN index bounds date-window scans with a few kilobytes of summaries
+-- instead of an entry per row. Per-region reads keep using the
+-- (region, hour_end) primary key; the trigger's delete by hour_end rechecks
+-- one 32-page range.
+
+CREATE INDEX ercot_load_long_hour_end_brin
+  ON ercot_load_long USING BRIN (hour_end) WITH (pages_per_range = 32);
+
+DROP INDEX ercot_load_long_hour_end_idx;
+
+ANALYZE ercot_load_long;
@@ -0,0 +1,21 @@
+-- Per-region, per-UTC-day partial sums of hourly load for /load/outliers.
+--
+-- A windowed outlier request needs the mean and standard deviation of each
+-- region's load over the window. When the window covers whole UTC days these
+-- follow from the daily count, sum and sum of squares, so the statistics read
+-- one row per region and day instead of every hour. Partial-day windows still
+-- aggregate ercot_load_long directly, as do days from the UTC day of the
+-- view's last refresh (staging.mv_refresh_state) onward.
+
+CREATE MATERIALIZED VIEW staging.region_daily_load_stats AS
+SELECT
+  region,
+  day_utc,
+  COUNT(load_mw)  AS n,
+  SUM(load_mw)    AS sum_mw,
+  SUM(load_mw^2)  AS sum_mw2
+FROM ercot_load_long
+GROUP BY region, day_utc;
+
+CREATE UNIQUE INDEX region_daily_load_stats_region_day_idx
+  ON staging.region_daily_load_stats (region, day_utc);
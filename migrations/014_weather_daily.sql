@@ -0,0 +1,20 @@
+-- Statewide daily weather averages behind /load/outliers/weather-conditions.
+--
+-- The endpoint aggregated all of weather_hourly to one row per UTC day on
+-- every call. Together with staging.ercot_daily_load (010) the query now
+-- reads only daily rows.
+
+CREATE MATERIALIZED VIEW staging.weather_daily AS
+SELECT
+  (wh.time AT TIME ZONE 'UTC')::date   AS day_utc,
+  AVG(wh.temperature_2m_c)             AS temp_c_avg,
+  AVG(wh.relative_humidity_2m_percent) AS rh_pct_avg,
+  SUM(wh.precipitation_mm)             AS precip_mm_sum,
+  AVG(wh.wind_speed_10m_kmh)           AS wind_10m_kmh_avg,
+  AVG(wh.pressure_msl_hpa)             AS pressure_hpa_avg,
+  AVG(wh.cloud_cover_mid_percent)      AS cloud_cover_pct_avg
+FROM weather_hourly wh
+GROUP BY (wh.time AT TIME ZONE 'UTC')::date;
+
+CREATE UNIQUE INDEX weather_daily_day_idx
+  ON staging.weather_daily (day_utc);
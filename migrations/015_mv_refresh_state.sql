@@ -0,0 +1,12 @@
+-- When the API last refreshed each materialized view.
+--
+-- The refresh loop reads this under its advisory lock, so the schedule is
+-- shared by every API worker and survives restarts instead of restarting its
+-- timer with each process. One row per view, holding the time its last
+-- refresh started; a view without a row is refreshed as soon as an API
+-- worker starts.
+
+CREATE TABLE staging.mv_refresh_state (
+  view_name    text PRIMARY KEY,
+  refreshed_at timestamptz NOT NULL
+);
@@ -0,0 +1,14 @@
+-- Monthly maintenance: restore hour_end ordering of the load tables.
+--
+-- CLUSTER takes an ACCESS EXCLUSIVE lock on each table while it runs, so
+-- schedule this outside dashboard hours. The tables are partitioned by month
+-- (see 004_partition_load_tables_by_month.sql), so the index must be named
+-- and Postgres 15 or later is required; each partition is clustered in turn.
+
+CLUSTER ercot_load USING ercot_load_hour_end_idx;
+CLUSTER staging.ercot_load_wide_compare USING ercot_load_wide_compare_hour_end_idx;
+CLUSTER staging.ercot_load_wide_compare_xgb USING ercot_load_wide_compare_xgb_hour_end_idx;
+
+VACUUM ANALYZE ercot_load;
+VACUUM ANALYZE staging.ercot_load_wide_compare;
+VACUUM ANALYZE staging.ercot_load_wide_compare_xgb;
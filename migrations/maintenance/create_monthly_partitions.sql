@@ -0,0 +1,9 @@
+-- Monthly maintenance: keep twelve months of empty partitions ahead of the data.
+--
+-- Rows for a month without its own partition go to the DEFAULT partition,
+-- and a month cannot be created once the DEFAULT partition holds rows for it.
+-- Run this before the loaders reach the last pre-created month.
+
+SELECT staging.create_monthly_partitions('ercot_load', current_date, (current_date + interval '12 months')::date);
+SELECT staging.create_monthly_partitions('staging.ercot_load_wide_compare', current_date, (current_date + interval '12 months')::date);
+SELECT staging.create_monthly_partitions('staging.ercot_load_wide_compare_xgb', current_date, (current_date + interval '12 months')::date);